@@ -1,32 +1,60 @@
 """Renders PowerPoint presentations easily with Python"""
 import logging
 import re
+import copy
 import io
+import os
+import sys
 import webbrowser
-from functools import singledispatch
-from typing import Union
+from collections import OrderedDict
+from functools import lru_cache
+from typing import IO, TYPE_CHECKING, Iterator, Optional, Tuple, Union
 
 import requests
 from pptx import Presentation
 from pptx.chart.chart import Chart
 from pptx.chart.data import CategoryChartData
 from pptx.shapes.base import BaseShape
+from pptx.shapes.group import GroupShape
 from pptx.shapes.picture import Picture
 from pptx.table import Table
-from pptx.text.text import TextFrame
-from pandas import DataFrame
+from pptx.text.text import TextFrame, _Run
+
+if TYPE_CHECKING:  # pragma: no cover
+    from pandas import DataFrame
+
+
+_PLACEHOLDER_RE = re.compile(r"\{(\w+)\}")
+
+# words used by PowerPoint in the names it gives to the shapes it creates, and the
+# "<Capitalised words> <number>" names PowerPoint and python-pptx give to any new shape
+_DEFAULT_NAME_RE = re.compile(
+    r"\b(?:Title|Placeholder|Connector|Elbow|Up|Left|Right|Down|Subtitle|TextBox)\b"
+    r"|^[A-Z][A-Za-z]*:?(?: [A-Z][A-Za-z]*:?)* \d+$"
+)
+
+# presentations are written in many small chunks, so files are buffered well above the default
+_FILE_BUFFER_SIZE = 1 << 20
+
+# templates up to this size are read into memory at once before being parsed
+_MAX_PRELOAD_SIZE = 64 << 20
+
+# number of parsed templates kept in memory by open_template
+_TEMPLATE_CACHE_SIZE = 8
 
 
 # TEMPLATE FUNCTIONS
 
-def open_template(template_name: str) -> Presentation:
+def open_template(template_name: Union[str, IO[bytes]]) -> Presentation:
     """
     Opens a pptx file given the template_name and returns it.
 
     Parameters
     ----------
-    template_name: str
-        The name of the file to be open.
+    template_name: str or file-like object
+        The name of the file to be open, or a binary file-like object with its content.
+        Templates opened by name are parsed once and kept in memory until the file changes,
+        ``open_template.cache_clear()`` discards them.
 
     Returns
     -------
@@ -39,8 +67,63 @@ def open_template(template_name: str) -> Presentation:
 
     >>> open_template('template.pptx')
     <pptx.presentation.Presentation at ...>
+
+    Open a ppt template already loaded in memory
+
+    >>> with open('template.pptx', 'rb') as file:
+    ...     template = io.BytesIO(file.read())
+    >>> open_template(template)
+    <pptx.presentation.Presentation at ...>
     """
-    return Presentation(template_name)
+    if hasattr(template_name, 'read'):
+        prs = Presentation(template_name)
+    else:
+        prs = _open_cached_template(os.path.abspath(template_name))
+
+    # the shapes are indexed by name on first use and the index is reused by every render
+    prs._pypyt_index = None  # pylint: disable=protected-access
+    return prs
+
+
+# parsed templates by (path, modification time, size), None for the templates opened only once
+_TEMPLATE_CACHE = OrderedDict()
+
+
+def _open_cached_template(path: str) -> Presentation:
+    """Returns a presentation of the template in the given path, the template is parsed once
+    until the file changes and each call gets its own copy"""
+    # the size is part of the key since the modification time can be too coarse to see a rewrite
+    stat = os.stat(path)
+    key = (path, stat.st_mtime_ns, stat.st_size)
+
+    # most templates are only opened once, so the first parse is returned without copying it
+    if key not in _TEMPLATE_CACHE:
+        _TEMPLATE_CACHE[key] = None
+        while len(_TEMPLATE_CACHE) > _TEMPLATE_CACHE_SIZE:
+            _TEMPLATE_CACHE.popitem(last=False)
+        return _load_template(path)
+
+    _TEMPLATE_CACHE.move_to_end(key)
+    if _TEMPLATE_CACHE[key] is None:
+        _TEMPLATE_CACHE[key] = _load_template(path)
+    return copy.deepcopy(_TEMPLATE_CACHE[key])
+
+
+def _load_template(path: str) -> Presentation:
+    """Parses the template in the given path"""
+    # reads the template in a single call instead of the many small reads of the zip reader
+    if os.path.getsize(path) > _MAX_PRELOAD_SIZE:
+        return Presentation(path)
+
+    with open(path, 'rb') as file:
+        return Presentation(io.BytesIO(file.read()))
+
+
+open_template.cache_clear = _TEMPLATE_CACHE.clear
+
+
+# alias kept for the presentation-oriented naming of the rest of the API
+open_ppt = open_template
 
 
 def render_template(template_name: str, values: dict, raise_error=False) -> Presentation:
@@ -110,42 +193,111 @@ def render_and_save_template(template_name: str,
     save_ppt(render_template(template_name, values, raise_error=raise_error), filename)
 
 
+def render_ppt_bytes(template_bytes: bytes, values: dict, raise_error=False) -> bytes:
+    """
+    Renders a template given as bytes and returns the rendered presentation as bytes, so
+    neither of them has to be written to disk.
+
+    Parameters
+    ----------
+    template_bytes: bytes
+        Content of the pptx file of the template.
+
+    values: dict
+        Dictionary with the values to render on the template.
+
+    raise_error: bool
+        Boolean that indicates whether an error has to be raised or not when is not possible to
+        render a shape
+
+    Returns
+    -------
+    bytes
+        Content of the pptx file of the rendered presentation
+
+    Examples
+    --------
+
+    Render a template kept in memory.
+
+    >>> with open('template.pptx', 'rb') as file:
+    ...     template_bytes = file.read()
+    >>> values = {'presentation_title': "My Cool Presentation"}
+    >>> render_ppt_bytes(template_bytes, values)
+    b'PK...'
+    """
+    prs = render_ppt(open_template(io.BytesIO(template_bytes)), values, raise_error=raise_error)
+
+    output = io.BytesIO()
+    prs.save(output)
+    return output.getvalue()
+
+
+def render_ppt_batch(template_name: str, values_list: list, raise_error=False) -> list:
+    """
+    Returns a rendered presentation for each of the given values. The template is opened and
+    parsed only once, and each presentation but the last is rendered into a copy of it.
+
+    Parameters
+    ----------
+    template_name: str
+        Name of the presentation to be rendered.
+
+    values_list: list
+        List of dictionaries with the values to render on each presentation.
+
+    raise_error: bool
+        Boolean that indicates whether an error has to be raised or not when is not possible to
+        render a shape
+
+    Returns
+    -------
+    list
+        List of rendered presentations, in the same order as values_list
+
+    Examples
+    --------
+
+    Render a template for several clients.
+
+    >>> values_list = [{'client_name': "My Client"}, {'client_name': "My Other Client"}]
+    >>> render_ppt_batch('template.pptx', values_list)
+    [<pptx.presentation.Presentation at ...>, <pptx.presentation.Presentation at ...>]
+    """
+    if not values_list:
+        return []
+
+    # the last presentation is rendered into the opened template itself instead of a copy
+    template = open_template(template_name)
+    presentations = [render_ppt(copy.deepcopy(template), values, raise_error=raise_error)
+                     for values in values_list[:-1]]
+    presentations.append(render_ppt(template, values_list[-1], raise_error=raise_error))
+    return presentations
+
+
 # PRESENTATION FUNCTIONS
 
 def _create_empty_values(shape) -> Union[str, list, dict]:
-    if is_hyperlink(shape):
-        return ''
-    elif is_paragraph(shape):
+    shape_type = get_shape_type(shape)
+
+    if shape_type == 'paragraph':
         placeholders = _get_placeholders(shape.text_frame)
 
         if placeholders:
             return {keyword: '' for keyword in placeholders}
         return ''
-    elif is_table(shape):
+    elif shape_type == 'table':
         return [[None for _ in row.cells] for row in shape.table.rows]
 
-    elif is_chart(shape):
+    elif shape_type == 'chart':
         return {'title': "", 'data': [], 'categories': []}
     else:
         return ''
 
 
+@lru_cache(maxsize=1024)
 def _is_default_name(name: str) -> bool:
-    _usual_default_words = {
-        'Title',
-        'Placeholder',
-        'Connector',
-        'Elbow', 'Up',
-        'Left',
-        'Right',
-        'Down',
-        'Subtitle',
-        'TextBox'
-    }
-
-    if name.istitle() or name.startswith('TextBox'):
-        return (set(name.split()) & _usual_default_words) != {}
-    return False
+    return name[:1].isupper() and _DEFAULT_NAME_RE.search(name) is not None
 
 
 def get_shapes(prs: Presentation, get_all=False) -> dict:
@@ -188,15 +340,18 @@ def get_shapes(prs: Presentation, get_all=False) -> dict:
      'slide_title': '',
      'table': [[None, None, None], [None, None, None], [None, None, None]]}
     """
-    if get_all:
-        return {shape.name: _create_empty_values(shape)
-                for slide in prs.slides
-                for shape in slide.shapes}
+    shapes = {}
+
+    for shape in _iter_shapes(prs):
+        name = shape.name
+
+        # the empty values of a name used by several shapes are only created once
+        if name in shapes or (not get_all and _is_default_name(name)):
+            continue
+
+        shapes[name] = _create_empty_values(shape)
 
-    return {shape.name: _create_empty_values(shape)
-            for slide in prs.slides
-            for shape in slide.shapes
-            if not _is_default_name(shape.name)}
+    return shapes
 
 
 def get_shapes_by_name(prs: Presentation, name: str) -> list:
@@ -221,10 +376,92 @@ def get_shapes_by_name(prs: Presentation, name: str) -> list:
     [<pptx.shapes.placeholder.PlaceholderGraphicFrame at ...>]
 
     """
-    return [shape for slide in prs.slides for shape in slide.shapes if shape.name == name]
+    return [indexed.shape for indexed in _get_index(prs).get(name, ())]
 
 
-def render_ppt(prs: Presentation, values: dict, raise_error=False) -> Presentation:
+def invalidate_index(prs: Presentation) -> None:
+    """
+    Discards the index of shapes by name kept by a presentation opened with open_template,
+    so it is built again on the next use. It has to be called after adding, removing or
+    renaming shapes in the presentation.
+
+    Parameters
+    ----------
+    prs: pptx.presentation.Presentation
+        Presentation whose index is discarded.
+
+    Examples
+    --------
+
+    Rename a shape and render it with its new name.
+
+    >>> prs = open_template('template.pptx')
+    >>> get_shapes_by_name(prs, 'client_name')[0].name = 'customer_name'
+    >>> invalidate_index(prs)
+    >>> render_ppt(prs, {'customer_name': "My Client"})
+    <pptx.presentation.Presentation at ...>
+    """
+    if hasattr(prs, '_pypyt_index'):
+        prs._pypyt_index = None  # pylint: disable=protected-access
+
+
+def _get_index(prs: Presentation) -> dict:
+    """Returns the index kept by the presentation, or a new one if it does not keep any"""
+    if not hasattr(prs, '_pypyt_index'):
+        return _index_shapes_by_name(prs)
+
+    if prs._pypyt_index is None:  # pylint: disable=protected-access
+        prs._pypyt_index = _index_shapes_by_name(prs)  # pylint: disable=protected-access
+    return prs._pypyt_index  # pylint: disable=protected-access
+
+
+def _index_shapes_by_name(prs: Presentation) -> dict:
+    """Returns the shapes of the presentation grouped by shape name"""
+    index = {}
+
+    for shape in _iter_shapes(prs):
+        index.setdefault(shape.name, []).append(_IndexedShape(shape))
+
+    return index
+
+
+class _IndexedShape:  # pylint: disable=too-few-public-methods
+    """Shape kept in the index of a presentation, its type is only resolved when it is looked
+    up and then kept for the next renders"""
+    __slots__ = ('shape', '_shape_type')
+
+    def __init__(self, shape: BaseShape):
+        self.shape = shape
+        self._shape_type = None
+
+    @property
+    def shape_type(self) -> str:
+        """Type of the shape, as returned by get_shape_type"""
+        if self._shape_type is None:
+            self._shape_type = get_shape_type(self.shape)
+        return self._shape_type
+
+
+def _iter_shapes(prs: Presentation) -> Iterator[BaseShape]:
+    for slide in prs.slides:
+        yield from slide.shapes
+
+
+# maps each shape type to the label used in error messages and the function rendering it
+_RENDERERS = {  # pylint: disable=unnecessary-lambda
+    'hyperlink': ('Hyperlink', lambda value, shape: render_hyperlink(value, shape)),
+    'paragraph': ('Paragraph', lambda value, shape: render_paragraph(value, shape.text_frame)),
+    'table': ('Table', lambda value, shape: render_table(value, shape.table)),
+    # the chart renderer takes the chart data already built by _build_chart_data
+    'chart': ('Chart', lambda chart_values, shape: _replace_chart_data(chart_values, shape.chart)),
+    'image': ('Picture', lambda value, shape: render_picture(value, shape)),
+}
+
+
+def render_ppt(prs: Presentation,
+               values: dict,
+               raise_error=False,
+               strict=False) -> Presentation:
     """
     Returns a rendered presentation given the template name and values to be rendered.
 
@@ -240,6 +477,10 @@ def render_ppt(prs: Presentation, values: dict, raise_error=False) -> Presentati
         Boolean that indicates whether an error has to be raised or not when is not possible to
         render a shape
 
+    strict: bool
+        Boolean that indicates whether a KeyError has to be raised, before rendering anything,
+        when there are items in values without any shape with their name in the presentation
+
     Returns
     -------
     pptx.presentation.Presentation
@@ -256,47 +497,56 @@ def render_ppt(prs: Presentation, values: dict, raise_error=False) -> Presentati
     <pptx.presentation.Presentation at ...>
     """
 
+    # indexes the shapes by name once, instead of scanning the slides for each item
+    index = _get_index(prs)
+
+    if strict:
+        missing = [key for key in values if key not in index]
+        if missing:
+            raise KeyError(f"No shapes named {', '.join(missing)} in the presentation")
+
     # checks each given item
-    for key, value in values.items():
-
-        # gets all the instances of the item in the presentation
-        for shape in get_shapes_by_name(prs, key):
-
-            # depending on what kind of item it is, it renders it
-            if is_hyperlink(shape):
-                try:
-                    render_hyperlink(value, shape)
-                except:  # pylint: disable=bare-except
-                    message = f"Failed to render Hyperlink {key}"
-                    _warn_or_fail(message, raise_error)
-            elif is_table(shape):
-                try:
-                    render_table(value, shape.table)
-                except:  # pylint: disable=bare-except
-                    message = f"Failed to render Table {key}"
-                    _warn_or_fail(message, raise_error)
-            elif is_paragraph(shape):
-                try:
-                    render_paragraph(value, shape.text_frame)
-                except:  # pylint: disable=bare-except
-                    message = f"Failed to render Paragraph {key}"
-                    _warn_or_fail(message, raise_error)
-            elif is_chart(shape):
-                try:
-                    render_chart(value, shape.chart)
-                except:  # pylint: disable=bare-except
-                    message = f"Failed to render Chart {key}"
-                    _warn_or_fail(message, raise_error)
-            elif is_picture(shape):
-                try:
-                    render_picture(value, shape)
-                except:  # pylint: disable=bare-except
-                    message = f"Failed to render Picture {key}"
-                    _warn_or_fail(message, raise_error)
+    replaced = [_render_item(key, value, index.get(key, ()), raise_error)
+                for key, value in values.items()]
+
+    # rendering a picture replaces its shape, so the index no longer matches the presentation
+    if any(replaced):
+        invalidate_index(prs)
 
     return prs
 
 
+def _render_item(key: str, value, shapes: list, raise_error=False) -> bool:
+    """Renders the value into all the given shapes with the name key, returns whether any shape
+    was replaced by a new one while rendering"""
+    replaced = False
+
+    # the chart data is built once and shared by all the charts with the same name
+    chart_values = None
+
+    for indexed in shapes:
+        shape, shape_type = indexed.shape, indexed.shape_type
+
+        # depending on what kind of item it is, it renders it
+        if shape_type not in _RENDERERS:
+            continue
+
+        label, renderer = _RENDERERS[shape_type]
+        try:
+            if shape_type == 'chart':
+                if chart_values is None:
+                    chart_values = _build_chart_data(value)
+                renderer(chart_values, shape)
+            else:
+                replaced = replaced or shape_type == 'image'
+                renderer(value, shape)
+        except:  # pylint: disable=bare-except
+            message = f"Failed to render {label} {key}"
+            _warn_or_fail(message, raise_error)
+
+    return replaced
+
+
 def render_and_save_ppt(prs: Presentation, values: dict, filename: str, raise_error=False) -> None:
     """
     Renders and save a presentation with the given template name,
@@ -350,7 +600,7 @@ def save_ppt(prs: Presentation, filename: str) -> None:
     >>> rendered_prs = render_template('template.pptx', values)
     >>> save_ppt(rendered_prs, 'presentation.pptx')
     """
-    with open(filename, 'wb') as file:
+    with open(filename, 'wb', buffering=_FILE_BUFFER_SIZE) as file:
         prs.save(file)
 
 
@@ -526,6 +776,9 @@ def is_hyperlink(shape: BaseShape) -> bool:
         >>> is_hyperlink(shapes[0])
         False
         """
+    # group shapes cannot have a click action, python-pptx raises when asked for it
+    if isinstance(shape, GroupShape):
+        return False
     return shape.click_action.hyperlink.address is not None
 
 
@@ -559,8 +812,7 @@ def render_hyperlink(values, hyperlink) -> None:
     hyperlink.click_action.hyperlink.address = values
 
 
-@singledispatch
-def render_chart(values: Union[dict, DataFrame], chart: Chart) -> None:  # pylint: disable=unused-argument
+def render_chart(values: Union[dict, 'DataFrame'], chart: Chart) -> None:
     """
     Renders the given values into the given chart.
 
@@ -619,12 +871,33 @@ def render_chart(values: Union[dict, DataFrame], chart: Chart) -> None:  # pylin
     >>> shape = shapes[0]
     >>> render_chart(pd_chart, shape.chart)
     """
-    raise NotImplementedError(f"Method not implemented for {type(values)} object type")
+    _replace_chart_data(_build_chart_data(values), chart)
 
 
-@render_chart.register(dict)
-def _(values: DataFrame, chart: Chart) -> None:
-    """Renders into the given chart the values in the DataFrame."""
+# chart data and title of a chart, built once from the values given to render it
+_ChartValues = Tuple[CategoryChartData, Optional[str]]
+
+
+def _build_chart_data(values: Union[dict, 'DataFrame']) -> _ChartValues:
+    """Returns the chart data and the title (if any) built from the given values"""
+    builder = _find_renderer(_CHART_DATA_BUILDERS, values)
+    if builder is None:
+        raise NotImplementedError(f"Method not implemented for {type(values)} object type")
+    return builder(values)
+
+
+def _replace_chart_data(chart_values: _ChartValues, chart: Chart) -> None:
+    """Renders into the given chart the chart data and title built by _build_chart_data"""
+    chart_data, title = chart_values
+
+    if title is not None:
+        chart.chart_title.text_frame.text = title
+
+    chart.replace_data(chart_data)
+
+
+def _chart_data_from_dict(values: dict) -> _ChartValues:
+    """Builds the chart data from the values in the dictionary."""
 
     chart_data = CategoryChartData()
 
@@ -633,30 +906,28 @@ def _(values: DataFrame, chart: Chart) -> None:
     for label, series in values['data'].items():
         chart_data.add_series(label, series)
 
-    if 'title' in values:
-        chart.chart_title.text_frame.text = values['title']
-
-    chart.replace_data(chart_data)
+    return chart_data, values.get('title')
 
 
-@render_chart.register(DataFrame)
-def _(values: DataFrame, chart: Chart) -> None:
-    """Renders into the given chart the values in the DataFrame."""
+def _chart_data_from_dataframe(values: 'DataFrame') -> _ChartValues:
+    """Builds the chart data from the values in the DataFrame."""
 
     chart_data = CategoryChartData()
 
-    chart_data.categories = list(values.index)
+    # the categories are read while iterating the index, so it does not need to be copied
+    chart_data.categories = values.index
 
-    for label in list(values):
-        chart_data.add_series(label, list(values[label].values))
+    for label in values.columns:
+        chart_data.add_series(label, values[label].to_numpy().tolist())
 
-    if hasattr(values, 'title'):
-        chart.chart_title.text_frame.text = values.title
+    return chart_data, getattr(values, 'title', None)
 
-    chart.replace_data(chart_data)
+
+_CHART_DATA_BUILDERS = {
+    dict: _chart_data_from_dict,
+}
 
 
-@singledispatch
 def render_paragraph(values, text_frame: TextFrame) -> None:
     """
     In the case you want to replace the whole text.
@@ -696,44 +967,92 @@ def render_paragraph(values, text_frame: TextFrame) -> None:
     >>> shape = shapes[0]
     >>> render_table(paragraph, shape.text_frame)
     """
+    _find_renderer(_PARAGRAPH_RENDERERS, values)(values, text_frame)
+
+
+def _render_paragraph_text(values, text_frame: TextFrame) -> None:
+    """In the case you want to replace the whole text"""
     paragraph = text_frame.paragraphs[0]
-    p = paragraph._p  # pylint: disable=protected-access,invalid-name
-    for idx, run in enumerate(paragraph.runs):
-        if idx == 0:
-            continue
-        p.remove(run._r)  # pylint: disable=protected-access
-    try:
-        paragraph.runs[0].text = values
-    except IndexError:
-        paragraph.text = values
+    _replace_paragraph_text(paragraph, values)
 
 
-@render_paragraph.register(dict)
-def _(values: dict, text_frame: TextFrame) -> None:
+def _render_paragraph_placeholders(values: dict, text_frame: TextFrame, cache=None) -> None:
     """In the case you want to replace placeholders within the paragraph"""
+    if cache is None:
+        cache = {}
+
     for paragraph in text_frame.paragraphs:
-        new_text_template = paragraph.text
-        keywords = re.findall(r"\{(\w+)\}", new_text_template)
-        if keywords:
-            new_text = new_text_template.format(**{k: values[k] for k in keywords})
-            p = paragraph._p  # pylint: disable=protected-access,invalid-name
-            for idx, run in enumerate(paragraph.runs):
-                if idx == 0:
-                    continue
-                p.remove(run._r)  # pylint: disable=protected-access
-            paragraph.runs[0].text = new_text
+        new_text = _format_placeholders(paragraph.text, values, cache)
+        if new_text is not None:
+            _replace_paragraph_text(paragraph, new_text)
 
 
-@render_paragraph.register(int)
-def _(values: int, text_frame: TextFrame) -> None:
-    """In case the values of the paragraph is not a text"""
-    render_paragraph(str(values), text_frame)
+def _format_placeholders(text: str, values: dict, cache: dict) -> Optional[str]:
+    """Returns the text with its placeholders replaced by the given values, or None if it has
+    no placeholders. The result is kept in cache so repeated texts are only formatted once"""
+    # most texts have no placeholders at all, which is cheaper to check than running the regex
+    if '{' not in text:
+        return None
+
+    if text not in cache:
+        parts = _split_placeholders(text)
+        if len(parts) == 1:
+            cache[text] = None
+        else:
+            cache[text] = ''.join(str(values[part]) if idx % 2 else part
+                                  for idx, part in enumerate(parts))
+    return cache[text]
 
 
-@render_paragraph.register(float)
-def _(values: int, text_frame: TextFrame) -> None:
+@lru_cache(maxsize=1024)
+def _split_placeholders(text: str) -> Tuple[str, ...]:
+    """Splits the text into literal chunks alternating with placeholder names, starting and
+    ending with a literal chunk. Texts are split once, however many times they are rendered"""
+    return tuple(_PLACEHOLDER_RE.split(text))
+
+
+def _render_paragraph_number(values: Union[int, float], text_frame: TextFrame) -> None:
     """In case the values of the paragraph is not a text"""
-    render_paragraph(str(values), text_frame)
+    _render_paragraph_text(str(values), text_frame)
+
+
+_PARAGRAPH_RENDERERS = {
+    str: _render_paragraph_text,
+    dict: _render_paragraph_placeholders,
+    int: _render_paragraph_number,
+    float: _render_paragraph_number,
+    object: _render_paragraph_text,
+}
+
+
+def _replace_paragraph_text(paragraph, text: str) -> None:
+    """Replaces the text of the paragraph keeping the format of its first run, if any"""
+    first_run = _collapse_to_first_run(paragraph)
+    if first_run is None:
+        paragraph.text = text
+    else:
+        first_run.text = text
+
+
+def _collapse_to_first_run(paragraph) -> Optional[_Run]:
+    """Removes every run of the paragraph but the first one, so its text can be replaced
+    keeping the format of the first run. Returns the first run, or None if there are no runs"""
+    runs = paragraph.runs
+    if not runs:
+        return None
+
+    if len(runs) > 1:
+        p = paragraph._p  # pylint: disable=protected-access,invalid-name
+        start = p.index(runs[1]._r)  # pylint: disable=protected-access
+        end = p.index(runs[-1]._r)  # pylint: disable=protected-access
+
+        # the extra runs are usually contiguous, so they can be removed in a single slice
+        if end - start == len(runs) - 2:
+            del p[start:end + 1]
+        else:
+            for run in runs[1:]:
+                p.remove(run._r)  # pylint: disable=protected-access
+    return runs[0]
 
 
 def _get_placeholders(text_frame: TextFrame) -> list:
@@ -741,15 +1060,15 @@ def _get_placeholders(text_frame: TextFrame) -> list:
 
     for paragraph in text_frame.paragraphs:
         new_text_template = paragraph.text
-        keywords = re.findall(r"\{(\w+)\}", new_text_template)
-        if keywords:
-            placeholders.extend(keywords)
+        if '{' not in new_text_template:
+            continue
+
+        placeholders.extend(_split_placeholders(new_text_template)[1::2])
 
     return placeholders
 
 
-@singledispatch
-def render_table(values: Union[dict, list, DataFrame], table: Table) -> None:  # pylint: disable=unused-argument
+def render_table(values: Union[dict, list, 'DataFrame'], table: Table) -> None:
     """
     Renders a table with the given values.
 
@@ -813,33 +1132,36 @@ def render_table(values: Union[dict, list, DataFrame], table: Table) -> None:  #
     >>> shape = shapes[0]
     >>> render_chart(table_df, shape.table)
     """
-    raise NotImplementedError
+    renderer = _find_renderer(_TABLE_RENDERERS, values)
+    if renderer is None:
+        raise NotImplementedError
+    renderer(values, table)
 
 
-@render_table.register(dict)
-def _(values: dict, table: Table) -> None:
+def _render_table_placeholders(values: dict, table: Table) -> None:
     """In the case you want to render placeholders within the table,
-    it will call render_paragraph for each cell"""
+    it will render the placeholders of each cell"""
+    cache = {}
     for row in table.rows:
         for cell in row.cells:
-            render_paragraph(values, cell.text_frame)
+            _render_paragraph_placeholders(values, cell.text_frame, cache)
 
 
-@render_table.register(DataFrame)
-def _(values: DataFrame, table: Table) -> None:
+def _render_table_dataframe(values: 'DataFrame', table: Table) -> None:
+    """In the case you want to render the table with the values in the DataFrame"""
     table_rows = iter(table.rows)
 
-    if hasattr(values, 'header') and values.header:
-        for values_cell, table_cell in zip(list(values), next(table_rows).cells):
-            render_paragraph(str(values_cell), table_cell.text_frame)
+    if getattr(values, 'header', False):
+        header_cells = next(table_rows).cells
+        for column, table_cell in zip(values.columns, header_cells):
+            _render_paragraph_text(str(column), table_cell.text_frame)
 
-    for values_row, table_row in zip(list(values.values), table_rows):
-        for values_cell, table_cell in zip(list(values_row), table_row.cells):
-            render_paragraph(str(values_cell), table_cell.text_frame)
+    for values_row, table_row in zip(values.itertuples(index=False, name=None), table_rows):
+        for values_cell, table_cell in zip(values_row, table_row.cells):
+            _render_paragraph_text(str(values_cell), table_cell.text_frame)
 
 
-@render_table.register(list)
-def _(values: list, table: Table) -> None:
+def _render_table_list(values: list, table: Table) -> None:
     """In the case you want to replace the whole table,
     it will set the value for each cell in the list"""
     for values_row, table_row in zip(values, table.rows):
@@ -847,6 +1169,12 @@ def _(values: list, table: Table) -> None:
             render_paragraph(values_cell, table_cell.text_frame)
 
 
+_TABLE_RENDERERS = {
+    dict: _render_table_placeholders,
+    list: _render_table_list,
+}
+
+
 def render_picture(values: Union[str, io.BytesIO], image: Picture) -> None:
     """
     Renders an image with the given values.
@@ -916,6 +1244,34 @@ def picture_from_url(url: str) -> io.BytesIO:
     return io.BytesIO(response.content)
 
 
+def _find_renderer(renderers: dict, values):
+    """Returns the renderer registered for the type of values or for its closest base class"""
+    # most values are of a registered type, which avoids walking their MRO
+    renderer = renderers.get(type(values))
+    if renderer is not None:
+        return renderer
+
+    for cls in type(values).__mro__:
+        if cls in renderers:
+            return renderers[cls]
+
+    # pandas is only imported by the callers that use it, so its renderers are registered late
+    if _register_dataframe_renderers():
+        return _find_renderer(renderers, values)
+    return None
+
+
+def _register_dataframe_renderers() -> bool:
+    """Registers the DataFrame renderers if pandas has been imported and they are not yet"""
+    pandas = sys.modules.get('pandas')
+    if pandas is None or pandas.DataFrame in _TABLE_RENDERERS:
+        return False
+
+    _CHART_DATA_BUILDERS[pandas.DataFrame] = _chart_data_from_dataframe
+    _TABLE_RENDERERS[pandas.DataFrame] = _render_table_dataframe
+    return True
+
+
 def _warn_or_fail(message, raise_error=False):
     if not raise_error:
         logging.warning(message)
@@ -10,7 +10,9 @@ setup(
     license='MIT',
     url='https://gitlab.criteois.com/j.gajardo/pypyt',
     packages=['pypyt'],
-    install_requires=['python-pptx>=0.6.15', 'pandas>=0.24.2']
+    python_requires='>=3.8',
+    install_requires=['python-pptx>=1.0'],
+    extras_require={'pandas': ['pandas>=2.0', 'numpy>=1.24']}
 )
 
 __author__ = 'Julio Gajardo'
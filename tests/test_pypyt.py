@@ -1,14 +1,22 @@
 """tests for pypyt"""
+import io
+import os
+import subprocess
+import sys
+
 import pandas as pd
 
 from pytest import fixture, raises
 from pptx.presentation import Presentation
+
+import pypyt
 from pypyt import get_shape_type, \
     get_shapes, \
     open_template, \
     get_shapes_by_name, \
+    invalidate_index, \
     render_chart, \
-    render_paragraph, render_table, render_ppt
+    render_paragraph, render_table, render_ppt, render_ppt_bytes, render_ppt_batch
 
 
 class FakePresentation:  # pylint: disable=too-few-public-methods
@@ -110,18 +118,6 @@ class FakeTable:  # pylint: disable=too-few-public-methods
                 and len(self.rows) == len(other.rows))
 
 
-class FakeHyperlink: # pylint: disable=too-few-public-methods
-    """fake class to test hyperlinks"""
-    def __init__(self):
-        self.address = None
-
-
-class FakeClickAction:  # pylint: disable=too-few-public-methods
-    """fake class to test hyperlinks"""
-    def __init__(self):
-        self.hyperlink = FakeHyperlink()
-
-
 class FakeTableShape(FakeShape):  # pylint: disable=too-few-public-methods
     """fake class to test table shapes"""
     def __init__(self, name, table: list):
@@ -254,6 +250,70 @@ def test_open():
     assert isinstance(open_template('tests/__template__.pptx'), Presentation)
 
 
+def test_open_cached_copies():
+    """test opening a template twice returns independent presentations"""
+    prs = open_template('tests/__template__.pptx')
+    render_ppt(prs, {'client_name': 'My Client'})
+
+    other_prs = open_template('tests/__template__.pptx')
+
+    assert other_prs is not prs
+    assert get_shapes_by_name(other_prs, 'client_name')[0].text_frame.text != 'My Client'
+
+
+def test_open_cached_rewritten_file(tmp_path, monkeypatch):
+    """test open a template again once its file is rewritten or the cache is cleared"""
+    path = str(tmp_path / 'template.pptx')
+    with open('tests/__template__.pptx', 'rb') as file:
+        template_bytes = file.read()
+    with open(path, 'wb') as file:
+        file.write(template_bytes)
+
+    parsed = []
+    parse = pypyt.Presentation
+    monkeypatch.setattr(pypyt, 'Presentation', lambda file: parsed.append(file) or parse(file))
+    open_template.cache_clear()
+
+    for _ in range(3):
+        open_template(path)
+    assert len(parsed) == 2
+
+    # rewrites the file keeping its modification time, as a coarse-mtime filesystem would
+    stat = os.stat(path)
+    render_ppt(open_template(path), {'client_name': 'My Client'}).save(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    prs = open_template(path)
+    assert get_shapes_by_name(prs, 'client_name')[0].text_frame.text == 'My Client'
+    assert len(parsed) == 3
+
+    open_template.cache_clear()
+    open_template(path)
+    assert len(parsed) == 4
+
+
+def test_render_ppt_bytes():
+    """test render a template in memory"""
+    with open('tests/__template__.pptx', 'rb') as file:
+        template_bytes = file.read()
+
+    rendered = render_ppt_bytes(template_bytes, {'client_name': 'My Client'})
+    prs = open_template(io.BytesIO(rendered))
+
+    assert get_shapes_by_name(prs, 'client_name')[0].text_frame.text == 'My Client'
+
+
+def test_render_ppt_batch():
+    """test render a template several times from a single parse"""
+    values_list = [{'client_name': 'My Client'}, {'client_name': 'My Other Client'}]
+
+    presentations = render_ppt_batch('tests/__template__.pptx', values_list)
+
+    assert [get_shapes_by_name(prs, 'client_name')[0].text_frame.text
+            for prs in presentations] == ['My Client', 'My Other Client']
+    assert render_ppt_batch('tests/__template__.pptx', []) == []
+
+
 def test_get_shapes(fake_presentation):  # pylint: disable=redefined-outer-name
     """test get shapes from presentation"""
 
@@ -337,6 +397,14 @@ def test_chart_invalid_values():
         render_chart(chart_invalid_data, FakeChart('shape_chart'))
 
 
+def test_table_invalid_values():
+    """test raise error with invalid values for tables"""
+    table_invalid_data = 'text'
+
+    with raises(NotImplementedError):
+        render_table(table_invalid_data, FakeTableShape('shape_table', [[None]]).table)
+
+
 def test_render_paragraph(fake_paragraph):  # pylint: disable=redefined-outer-name
     """render string paragraph"""
     values = 'rendered text'
@@ -373,6 +441,15 @@ def test_render_table(table_values_list, table_values_df):
     assert fake_table_df == fake_table_list
 
 
+def test_render_table_iterable_rows():
+    """test render list table whose rows are iterators"""
+    table = get_shapes_by_name(open_template('tests/__template__.pptx'), 'table_merge')[0].table
+    render_table([iter(['a', 'b', 'c']), map(str, [1, 2, 3])], table)
+
+    assert [cell.text for cell in table.rows[0].cells] == ['a', 'b', 'c']
+    assert [cell.text for cell in table.rows[1].cells] == ['1', '2', '3']
+
+
 def test_render_ppt(fake_presentation):
 
     values_1 = {
@@ -395,3 +472,146 @@ def test_render_ppt(fake_presentation):
 
     render_ppt(fake_presentation, values_1)
     assert True
+
+
+def test_render_table_header():
+    """test render a dataframe table with its header"""
+    values = pd.DataFrame([[1, 2, 3], [4, 5, 6]], columns=['a', 'b', 'c'])
+    values.header = True
+
+    header_table = FakeTableShape('fake_table', [[None, None, None]] * 3)
+    render_table(values, header_table.table)
+
+    assert header_table == FakeTableShape('fake_table',
+                                          [['a', 'b', 'c'], ['1', '2', '3'], ['4', '5', '6']])
+
+
+def test_render_table_mixed_dtypes():
+    """test render a dataframe table keeping the dtype of each column"""
+    values = pd.DataFrame([[1, 2.5], [3, 4.0]])
+
+    mixed_table = FakeTableShape('fake_table', [[None, None]] * 2)
+    render_table(values, mixed_table.table)
+
+    assert mixed_table == FakeTableShape('fake_table', [['1', '2.5'], ['3', '4.0']])
+
+
+def test_get_shapes_default_names():
+    """test only shapes named like the ones created by powerpoint are filtered out"""
+    prs = FakePresentation([FakeSlide([
+        FakeShape('Title 1'),
+        FakeShape('TextBox 2'),
+        FakeShape('Elbow Connector 3'),
+        FakeShape('Picture 2'),
+        FakeShape('Rectangle 5'),
+        FakeShape('Rounded Rectangle 7'),
+        FakeShape('Freeform: Shape 8'),
+        FakeShape('Client Logo'),
+        FakeShape('Sales'),
+        FakeShape('sales 2019'),
+    ])])
+
+    assert get_shapes(prs) == {'Client Logo': '', 'Sales': '', 'sales 2019': ''}
+
+
+def test_import_without_pandas():
+    """test pandas is not imported until a DataFrame is rendered"""
+    code = "import sys, pypyt; sys.exit('pandas' in sys.modules)"
+    assert subprocess.run([sys.executable, '-c', code], check=False).returncode == 0
+
+
+def test_invalidate_index():
+    """test the index of an opened template is kept until it is invalidated"""
+    prs = open_template('tests/__template__.pptx')
+    shape = get_shapes_by_name(prs, 'client_name')[0]
+    shape.name = 'customer_name'
+
+    assert get_shapes_by_name(prs, 'customer_name') == []
+
+    invalidate_index(prs)
+
+    assert get_shapes_by_name(prs, 'customer_name') == [shape]
+
+
+def test_render_paragraph_placeholder_no_runs():
+    """test render dict paragraph whose text is not held in runs"""
+    paragraph = FakeParagraph('one {place}')
+    paragraph.runs = []
+    render_paragraph({'place': 'rendered text'}, FakeTextFrame([paragraph]))
+
+    assert paragraph.text == 'one rendered text'
+
+
+def test_render_paragraph_placeholder_braces():
+    """test render dict paragraph keeping the braces that are not placeholders"""
+    paragraph = FakeParagraphShape('shape_paragraph',
+                                   FakeTextFrame([FakeParagraph('{count} items in {a set')]))
+    render_paragraph({'count': 3}, paragraph.text_frame)
+
+    assert paragraph == FakeParagraphShape('shape_paragraph',
+                                           FakeTextFrame([FakeParagraph('3 items in {a set')]))
+
+
+def test_render_ppt_strict(fake_presentation):  # pylint: disable=redefined-outer-name
+    """test strict render fails before rendering when a name is not in the presentation"""
+    values = {'shape_paragraph': 'rendered text', 'unknown_shape': 'text'}
+
+    with raises(KeyError):
+        render_ppt(fake_presentation, values, strict=True)
+
+    assert get_shapes_by_name(fake_presentation, 'shape_paragraph')[0].text_frame == \
+        FakeTextFrame([FakeParagraph('text')])
+
+
+def test_render_ppt_group_shape():
+    """test render a presentation that contains a group shape"""
+    prs = open_template('tests/__template__.pptx')
+    slide = prs.slides[0]
+    group = slide.shapes.add_group_shape()
+    group.shapes.add_textbox(0, 0, 100, 100)
+    text_box = slide.shapes.add_textbox(0, 0, 100, 100)
+    text_box.name = 'group_test'
+    text_box.text_frame.text = 'text'
+    invalidate_index(prs)
+
+    render_ppt(prs, {'group_test': 'My Client'}, raise_error=True)
+
+    assert get_shape_type(group) == ''
+    assert get_shapes_by_name(prs, 'group_test')[0].text_frame.text == 'My Client'
+
+
+def _text_box_paragraph(*texts, line_break=False):
+    """returns a real python-pptx text frame with a paragraph holding a run per text"""
+    slide = open_template('tests/__template__.pptx').slides[0]
+    text_frame = slide.shapes.add_textbox(0, 0, 100, 100).text_frame
+    paragraph = text_frame.paragraphs[0]
+    for position, text in enumerate(texts):
+        if line_break and position == len(texts) - 1:
+            paragraph.add_line_break()
+        paragraph.add_run().text = text
+    return text_frame
+
+
+def _child_tags(paragraph):
+    """returns the tags, without namespace, of the elements within a paragraph"""
+    return [child.tag.rsplit('}', 1)[-1] for child in paragraph._p]  # pylint: disable=protected-access
+
+
+def test_render_paragraph_contiguous_runs():
+    """test render a paragraph whose text is split in contiguous runs"""
+    text_frame = _text_box_paragraph('one ', '{place}', ' two')
+    render_paragraph({'place': 'rendered text'}, text_frame)
+    paragraph = text_frame.paragraphs[0]
+
+    assert [run.text for run in paragraph.runs] == ['one rendered text two']
+    assert _child_tags(paragraph) == ['r']
+
+
+def test_render_paragraph_runs_with_line_break():
+    """test render a paragraph whose runs are separated by a line break"""
+    text_frame = _text_box_paragraph('one ', 'two', 'three', line_break=True)
+    render_paragraph('rendered text', text_frame)
+    paragraph = text_frame.paragraphs[0]
+
+    assert [run.text for run in paragraph.runs] == ['rendered text']
+    assert _child_tags(paragraph) == ['r', 'br']